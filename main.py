@@ -1,12 +1,30 @@
 import discord
-from discord.ext import commands, tasks
+from discord.ext import commands
 import aiohttp
 import os
+import hashlib
 from dotenv import load_dotenv
 from datetime import datetime, timedelta
 import json
 import asyncio
-import pytz
+import traceback
+from zoneinfo import ZoneInfo
+
+try:
+    import orjson
+
+    def json_loads(raw):
+        return orjson.loads(raw)
+
+    def json_dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    # Fall back to stdlib json so the bot still runs without the orjson wheel
+    def json_loads(raw):
+        return json.loads(raw)
+
+    def json_dumps(obj):
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
 
 # -------------------------------
 # Load environment
@@ -23,15 +41,24 @@ HEADERS = {
 
 POSTED_FILE = "posted_games.json"
 CHANNEL_NAME = "free-games"
-CET = pytz.timezone('Europe/Warsaw')
+CET = ZoneInfo("Europe/Warsaw")
 API_CALL_LOG = "api_calls.json"
+# keyImages types usable as a wide embed image, in order of preference
+WIDE_IMAGE_TYPES = ("DieselStoreFrontWide", "OfferImageWide")
+ONE_HOUR = timedelta(hours=1)
+DATE_FORMAT = "%Y-%m-%d %H:%M"
+MAX_EMBEDS_PER_MESSAGE = 10
+MAX_EMBED_CHARS_PER_MESSAGE = 6000
+DAILY_RETRY_SECONDS = 15 * 60
+DAILY_MAX_RETRIES = 4
+DAILY_MAX_SLEEP_SECONDS = 60 * 60
 
 # API call tracking
 def get_api_call_count():
     """Get current API call count for this month"""
     try:
-        with open(API_CALL_LOG, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        with open(API_CALL_LOG, "rb") as f:
+            data = json_loads(f.read())
             return data.get("count", 0), data.get("month", "")
     except (FileNotFoundError, json.JSONDecodeError):
         return 0, ""
@@ -46,26 +73,47 @@ def increment_api_calls():
         count = 0
     
     count += 1
-    with open(API_CALL_LOG, "w", encoding="utf-8") as f:
-        json.dump({"count": count, "month": current_month}, f)
+    with open(API_CALL_LOG, "wb") as f:
+        f.write(json_dumps({"count": count, "month": current_month}))
     
     return count
 
+# Serializes the read-modify-write of the API call log across overlapping fetches
+api_calls_lock = asyncio.Lock()
+
+async def bump_api_calls():
+    """Run increment_api_calls in a worker thread so file I/O doesn't block the event loop"""
+    async with api_calls_lock:
+        return await asyncio.to_thread(increment_api_calls)
+
 # -------------------------------
 # Discord bot setup
 # -------------------------------
+class FredBot(commands.Bot):
+    async def setup_hook(self):
+        # Runs once per login, unlike on_ready which fires again on every reconnect
+        open_http_session()
+
+    async def close(self):
+        # Covers every exit path (/shutdown, Ctrl+C, bot.run returning), not just /shutdown
+        await close_http_session()
+        await super().close()
+
 intents = discord.Intents.default()
 intents.message_content = True
-bot = commands.Bot(command_prefix="/", intents=intents)
+bot = FredBot(command_prefix="/", intents=intents)
 
 pending_confirmations = {}
+http_session: aiohttp.ClientSession | None = None
+_channel_cache: list[discord.TextChannel] | None = None
+daily_task: asyncio.Task | None = None
 
 # -------------------------------
 # Load or initialize posted games
 # -------------------------------
 try:
-    with open(POSTED_FILE, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    with open(POSTED_FILE, "rb") as f:
+        data = json_loads(f.read())
         posted_games = data.get("current", [])
         posted_upcoming = data.get("upcoming", [])
         last_daily_run = data.get("last_daily_run", None)
@@ -74,125 +122,247 @@ except (FileNotFoundError, json.JSONDecodeError):
     posted_upcoming = []
     last_daily_run = None
 
+# Titles of posted_games, kept in sync so run_check doesn't rebuild the set each time
+_posted_games_titles = frozenset(g.get("title") for g in posted_games)
+
+# Embeds for posted games, rebuilt lazily after run_check changes them
+_cached_current_embeds = None
+_cached_upcoming_embeds = None
+
+_last_saved_sig = None
+
 def save_posted():
     """Save posted games and ensure no duplicates between current and upcoming"""
+    global _last_saved_sig
     # Clean: remove any upcoming games that are also current
     current_titles = {g.get("title") for g in posted_games}
     clean_upcoming = [g for g in posted_upcoming if g.get("title") not in current_titles]
     
-    with open(POSTED_FILE, "w", encoding="utf-8") as f:
-        json.dump({
-            "current": posted_games,
-            "upcoming": clean_upcoming,
-            "last_daily_run": last_daily_run
-        }, f, ensure_ascii=False, indent=2)
+    payload = json_dumps({
+        "current": posted_games,
+        "upcoming": clean_upcoming,
+        "last_daily_run": last_daily_run
+    })
+
+    # Skip the write if nothing changed since the last save
+    sig = hashlib.blake2b(payload, digest_size=16).digest()
+    if sig == _last_saved_sig:
+        return
+
+    # Write to a temp file and swap it in, so a crash can't leave a truncated file
+    tmp_file = POSTED_FILE + ".tmp"
+    try:
+        with open(tmp_file, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_file, POSTED_FILE)
+    except OSError as e:
+        # Leave _last_saved_sig alone so the next save retries
+        print(f"Failed to save {POSTED_FILE}: {e}")
+        try:
+            os.remove(tmp_file)
+        except OSError:
+            pass
+        return
+    _last_saved_sig = sig
+
+# Keeps overlapping run_checks from racing on the temp file and _last_saved_sig
+save_lock = asyncio.Lock()
+
+async def save_posted_async():
+    """Run save_posted in a worker thread so file I/O doesn't block the event loop"""
+    async with save_lock:
+        await asyncio.to_thread(save_posted)
 
 # -------------------------------
 # Helper functions
 # -------------------------------
 def get_free_game_channels():
-    """Find all channels named 'free-games' across all guilds"""
-    channels = []
-    for guild in bot.guilds:
-        for channel in guild.text_channels:
-            if channel.name == CHANNEL_NAME:
-                channels.append(channel)
-    return channels
+    """Find all channels named 'free-games' across all guilds (cached until channels/guilds change)"""
+    global _channel_cache
+    if _channel_cache is None:
+        _channel_cache = [
+            channel
+            for guild in bot.guilds
+            for channel in guild.text_channels
+            if channel.name == CHANNEL_NAME
+        ]
+    return _channel_cache
+
+def invalidate_channel_cache():
+    global _channel_cache
+    _channel_cache = None
+
+def open_http_session():
+    """Create the shared HTTP session (keeps the RapidAPI connection warm between calls)"""
+    global http_session
+    if http_session is None or http_session.closed:
+        http_session = aiohttp.ClientSession(
+            headers=HEADERS,
+            timeout=aiohttp.ClientTimeout(total=10),
+            connector=aiohttp.TCPConnector(limit=10, ttl_dns_cache=300, keepalive_timeout=75)
+        )
+
+async def close_http_session():
+    """Close the shared HTTP session if it is open"""
+    global http_session
+    if http_session is not None and not http_session.closed:
+        await http_session.close()
+    http_session = None
+
+# Validators and body of the last successful response, for conditional requests
+_last_etag = None
+_last_modified = None
+_last_payload = None
 
 async def fetch_games():
+    global _last_etag, _last_modified, _last_payload
     try:
-        call_count = increment_api_calls()
+        call_count = await bump_api_calls()
         print(f"API call #{call_count}/60")
         if call_count > 58:
             print("WARNING: Approaching API limit!")
-        
-        timeout = aiohttp.ClientTimeout(total=10)
-        async with aiohttp.ClientSession(headers=HEADERS, timeout=timeout) as session:
-            async with session.get(EPIC_API_URL) as resp:
-                if resp.status != 200:
-                    print(f"API error: {resp.status}")
-                    return None
-                return await resp.json()
+
+        headers = {}
+        if _last_etag:
+            headers["If-None-Match"] = _last_etag
+        if _last_modified:
+            headers["If-Modified-Since"] = _last_modified
+
+        async with http_session.get(EPIC_API_URL, headers=headers) as resp:
+            if resp.status == 304 and _last_payload is not None:
+                print("API data unchanged since last fetch")
+                return _last_payload
+            if resp.status != 200:
+                print(f"API error: {resp.status}")
+                return None
+            data = await resp.json()
+            _last_etag = resp.headers.get("ETag")
+            _last_modified = resp.headers.get("Last-Modified")
+            _last_payload = data
+            return data
     except Exception as e:
         print(f"Error fetching games: {e}")
         return None
 
+def format_epic_date(s):
+    """Convert an Epic ISO-8601 UTC timestamp to a CET display string, or return it unchanged if unparsable"""
+    if not s:
+        return None
+    if not isinstance(s, str):
+        return str(s)
+    try:
+        return (datetime.fromisoformat(s[:-1] + "+00:00" if s.endswith("Z") else s) + ONE_HOUR).strftime(DATE_FORMAT)
+    except ValueError:
+        return s
+
 def make_embeds(games, ctx_mention=None, upcoming=False, wide_image=False):
+    # Local aliases avoid repeated global/attribute lookups inside the loop
+    Embed = discord.Embed
+    COLOR = 0x1E3A8A
+    fmt_date = format_epic_date
+    date_label = "Available From" if upcoming else "Available Until"
+    footer = f"Checked by {ctx_mention}" if ctx_mention else None
+
     embeds = []
+    append = embeds.append
     for g in games:
-        title = g.get("title", "Unknown Game")
-        desc = g.get("description", "No description")
-        seller = g.get("seller", {}).get("name", "Unknown")
-        slug = g.get("urlSlug")
-        url = f"https://www.epicgames.com/store/p/{slug}" if slug else "No link"
+        get = g.get
+        title = get("title", "Unknown Game")
+        desc = get("description", "No description")
+        seller = get("seller", {}).get("name", "Unknown")
 
         date_field = None
         if upcoming:
-            date_field = g.get("effectiveDate", "Unknown start")
-            if date_field:
-                try:
-                    dt = datetime.fromisoformat(date_field.replace("Z", "+00:00")) + timedelta(hours=1)
-                    date_field = dt.strftime("%Y-%m-%d %H:%M")
-                except:
-                    pass
+            date_field = fmt_date(get("effectiveDate", "Unknown start"))
         else:
-            promos = g.get("promotions", {}).get("promotionalOffers", [])
-            if promos and promos[0].get("promotionalOffers"):
-                end_raw = promos[0]["promotionalOffers"][0].get("endDate")
-                if end_raw:
-                    try:
-                        dt = datetime.fromisoformat(end_raw.replace("Z", "+00:00")) + timedelta(hours=1)
-                        date_field = dt.strftime("%Y-%m-%d %H:%M")
-                    except:
-                        pass
-
-        image_url = None
-        thumbnail_url = None
-        
-        for img in g.get("keyImages", []):
-            img_type = img.get("type")
-            if wide_image and img_type in ["DieselStoreFrontWide", "OfferImageWide"]:
-                image_url = img.get("url")
-                break
-            elif img_type == "Thumbnail":
-                thumbnail_url = img.get("url")
-        
+            try:
+                date_field = fmt_date(g["promotions"]["promotionalOffers"][0]["promotionalOffers"][0].get("endDate"))
+            except (KeyError, IndexError, TypeError):
+                pass
+
+        imgs = {img.get("type"): img.get("url") for img in get("keyImages", ())}
+        thumbnail_url = imgs.get("Thumbnail")
+        image_url = next((imgs[t] for t in WIDE_IMAGE_TYPES if t in imgs), None) if wide_image else None
+
         if wide_image and not image_url:
             image_url = thumbnail_url
 
-        embed = discord.Embed(title=title, description=desc, color=0x1E3A8A)
-        embed.add_field(name="Seller", value=seller, inline=True)
-        
+        embed = Embed(title=title, description=desc, color=COLOR)
+        add_field = embed.add_field
+        add_field(name="Seller", value=seller, inline=True)
         if date_field:
-            if upcoming:
-                embed.add_field(name="Available From", value=date_field, inline=True)
-            else:
-                embed.add_field(name="Available Until", value=date_field, inline=True)
-        
+            add_field(name=date_label, value=date_field, inline=True)
+
         if wide_image and image_url:
             embed.set_image(url=image_url)
         elif thumbnail_url:
             embed.set_thumbnail(url=thumbnail_url)
-            
-        if ctx_mention:
-            embed.set_footer(text=f"Checked by {ctx_mention}")
-            
-        embeds.append(embed)
+
+        if footer:
+            embed.set_footer(text=footer)
+
+        append(embed)
     return embeds
 
-def are_games_same(new_games, old_games):
-    new_titles = {g.get("title") for g in new_games}
-    old_titles = {g.get("title") for g in old_games}
-    return new_titles == old_titles
+def get_cached_embeds(upcoming=False, ctx_mention=None):
+    """Return embeds for posted games, building them only once between checks"""
+    global _cached_current_embeds, _cached_upcoming_embeds
+    if upcoming:
+        if _cached_upcoming_embeds is None:
+            _cached_upcoming_embeds = make_embeds(posted_upcoming, upcoming=True, wide_image=True)
+        embeds = _cached_upcoming_embeds
+    else:
+        if _cached_current_embeds is None:
+            _cached_current_embeds = make_embeds(posted_games, upcoming=False, wide_image=True)
+        embeds = _cached_current_embeds
+
+    if ctx_mention:
+        # Footer is per-user, so put it on a copy and keep the cached embeds clean
+        return [e.copy().set_footer(text=f"Checked by {ctx_mention}") for e in embeds]
+    return list(embeds)
+
+_target_cache = None
+
+def daily_target_for(now):
+    """Return today's 17:01 CET check time, recomputed only when the date changes"""
+    global _target_cache
+    today = now.date()
+    if _target_cache is None or _target_cache[0] != today:
+        _target_cache = (today, now.replace(hour=17, minute=1, second=0, microsecond=0))
+    return _target_cache[1]
+
+def prune_pending_confirmations(now):
+    """Drop expired /confirm entries so the dict doesn't grow forever"""
+    for mention in [m for m, expiry in pending_confirmations.items() if expiry <= now]:
+        del pending_confirmations[mention]
+
+def batch_embeds(embeds):
+    """Split embeds into message-sized batches (max 10 embeds and 6000 embed characters each)"""
+    batch, size = [], 0
+    for e in embeds:
+        n = len(e)
+        if batch and (len(batch) == MAX_EMBEDS_PER_MESSAGE or size + n > MAX_EMBED_CHARS_PER_MESSAGE):
+            yield batch
+            batch, size = [], 0
+        batch.append(e)
+        size += n
+    if batch:
+        yield batch
+
+async def send_embeds(send, header, embeds):
+    """Send embeds in as few messages as Discord's per-message limits allow"""
+    content = header
+    for batch in batch_embeds(embeds):
+        if content:
+            await send(content=content, embeds=batch)
+            content = None
+        else:
+            await send(embeds=batch)
 
 async def run_check(ctx_mention=None, force=False, interaction_channel=None, is_auto_check=False):
-    global last_daily_run, posted_games, posted_upcoming
+    global last_daily_run, posted_games, posted_upcoming, _posted_games_titles, _cached_current_embeds, _cached_upcoming_embeds
     
-    data = await fetch_games()
-    if not data:
-        print("Failed to fetch games")
-        return False
-
+    # Look for channels first so a guild without one doesn't burn an API call
     if interaction_channel:
         channels = [interaction_channel]
     else:
@@ -202,37 +372,47 @@ async def run_check(ctx_mention=None, force=False, interaction_channel=None, is_
         print("No channels found to post to")
         return False
 
+    data = await fetch_games()
+    if not data:
+        print("Failed to fetch games")
+        return False
+
+    now = datetime.now(CET)
+    prune_pending_confirmations(now)
+
     current_games = data.get("currentGames", [])
     next_games = data.get("nextGames", [])
     
     current_titles = {g.get("title") for g in current_games}
 
-    if are_games_same(current_games, posted_games) and not force:
+    if not force and current_titles == _posted_games_titles:
         if ctx_mention and interaction_channel:
-            pending_confirmations[ctx_mention] = datetime.now(CET) + timedelta(minutes=1)
+            pending_confirmations[ctx_mention] = now + timedelta(minutes=1)
             await interaction_channel.send(f"{ctx_mention}, games are the same as last check. Use /confirm within 1 min to see them again.")
         # For auto checks, still mark as run even if games are the same
         if is_auto_check:
-            now = datetime.now(CET)
             last_daily_run = str(now.date())
-            save_posted()
+            await save_posted_async()
         return True
 
     posted_games = current_games.copy()
+    _posted_games_titles = frozenset(current_titles)
     
     # Remove games that are now current from the upcoming list
     posted_upcoming = [g for g in posted_upcoming if g.get("title") not in current_titles]
 
     # Add only new upcoming games that aren't already listed or currently free
-    new_upcoming = [g for g in next_games if g.get("title") not in current_titles and g.get("title") not in [u.get("title") for u in posted_upcoming]]
+    existing_upcoming_titles = {u.get("title") for u in posted_upcoming}
+    new_upcoming = [g for g in next_games if (t := g.get("title")) not in current_titles and t not in existing_upcoming_titles]
     posted_upcoming.extend(new_upcoming)
+    _cached_current_embeds = None
+    _cached_upcoming_embeds = None
 
     # Mark API call as done for today ONLY if this is an automatic check
     if is_auto_check:
-        now = datetime.now(CET)
         last_daily_run = str(now.date())
     
-    save_posted()
+    await save_posted_async()
 
     embeds_current = make_embeds(current_games, ctx_mention=ctx_mention, upcoming=False, wide_image=True)
     embeds_upcoming = make_embeds(new_upcoming, ctx_mention=ctx_mention, upcoming=True, wide_image=True)
@@ -240,14 +420,10 @@ async def run_check(ctx_mention=None, force=False, interaction_channel=None, is_
     for channel in channels:
         try:
             if embeds_current:
-                await channel.send("**Current Free Games:**")
-                for e in embeds_current:
-                    await channel.send(embed=e)
+                await send_embeds(channel.send, "**Current Free Games:**", embeds_current)
 
             if embeds_upcoming:
-                await channel.send("**Upcoming Free Games:**")
-                for e in embeds_upcoming:
-                    await channel.send(embed=e)
+                await send_embeds(channel.send, "**Upcoming Free Games:**", embeds_upcoming)
             
             print(f"Posted to {channel.guild.name} - #{channel.name}")
         except Exception as e:
@@ -260,8 +436,9 @@ async def run_check(ctx_mention=None, force=False, interaction_channel=None, is_
 # -------------------------------
 @bot.event
 async def on_ready():
-    global last_daily_run
+    global last_daily_run, daily_task
     now = datetime.now(CET)
+    invalidate_channel_cache()
     print(f"Bot logged in as {bot.user}")
     print(f"Connected to {len(bot.guilds)} guilds")
     
@@ -320,7 +497,7 @@ async def on_ready():
     ))
     
     today_str = str(now.date())
-    target_time = datetime.now(CET).replace(hour=17, minute=1, second=0, microsecond=0)
+    target_time = daily_target_for(now)
     
     print(f"Current time: {now.strftime('%Y-%m-%d %H:%M:%S CET')}")
     print(f"Last daily run: {last_daily_run}")
@@ -337,65 +514,90 @@ async def on_ready():
     else:
         print(f"No startup check needed (last run: {last_daily_run}, current: {today_str})")
     
-    daily_check.start()
+    if daily_task is None or daily_task.done():
+        daily_task = asyncio.create_task(daily_loop())
+
+@bot.event
+async def on_guild_channel_create(channel):
+    invalidate_channel_cache()
+
+@bot.event
+async def on_guild_channel_delete(channel):
+    invalidate_channel_cache()
+
+@bot.event
+async def on_guild_channel_update(before, after):
+    invalidate_channel_cache()
+
+@bot.event
+async def on_guild_join(guild):
+    invalidate_channel_cache()
+
+@bot.event
+async def on_guild_remove(guild):
+    invalidate_channel_cache()
 
 # -------------------------------
 # Commands
 # -------------------------------
+# Static response embeds, built once and reused
+COMMANDS_EMBED = discord.Embed(title="Fred - Epic Games Tracker", description="Track free Epic Games automatically.", color=0x1E3A8A)
+COMMANDS_EMBED.add_field(name="/current", value="Show current free games", inline=False)
+COMMANDS_EMBED.add_field(name="/upcoming", value="Show upcoming free games", inline=False)
+COMMANDS_EMBED.add_field(name="/next", value="Time until next check", inline=False)
+COMMANDS_EMBED.add_field(name="/confirm", value="Show games again", inline=False)
+COMMANDS_EMBED.add_field(name="/setup", value="Create free-games channel", inline=False)
+COMMANDS_EMBED.add_field(name="/check", value="Manual check (owner only)", inline=False)
+COMMANDS_EMBED.add_field(name="/shutdown", value="Shut down bot (owner only)", inline=False)
+COMMANDS_EMBED.set_footer(text="Daily check at 17:01 CET")
+
+# Template for /next; the two fields are filled in per invocation
+NEXT_CHECK_EMBED = discord.Embed(
+    title="Next Automatic Check",
+    description="Next check: **17:01 CET**",
+    color=0x1E3A8A
+)
+NEXT_CHECK_EMBED.add_field(name="Time Remaining", value="-", inline=True)
+NEXT_CHECK_EMBED.add_field(name="Date", value="-", inline=True)
+
 @bot.tree.command(name="commands", description="Show all available commands")
 async def commands_slash(interaction: discord.Interaction):
-    embed = discord.Embed(title="Fred - Epic Games Tracker", description="Track free Epic Games automatically.", color=0x1E3A8A)
-    embed.add_field(name="/current", value="Show current free games", inline=False)
-    embed.add_field(name="/upcoming", value="Show upcoming free games", inline=False)
-    embed.add_field(name="/next", value="Time until next check", inline=False)
-    embed.add_field(name="/confirm", value="Show games again", inline=False)
-    embed.add_field(name="/setup", value="Create free-games channel", inline=False)
-    embed.add_field(name="/check", value="Manual check (owner only)", inline=False)
-    embed.add_field(name="/shutdown", value="Shut down bot (owner only)", inline=False)
-    embed.set_footer(text="Daily check at 17:01 CET")
-    await interaction.response.send_message(embed=embed)
+    await interaction.response.send_message(embed=COMMANDS_EMBED)
 
 @bot.tree.command(name="current", description="Show current free games")
 async def current_slash(interaction: discord.Interaction):
-    await interaction.response.defer()
-    embeds = make_embeds(posted_games, ctx_mention=interaction.user.mention, upcoming=False, wide_image=True)
+    await interaction.response.defer(thinking=False)
+    embeds = get_cached_embeds(upcoming=False, ctx_mention=interaction.user.mention)
     if embeds:
-        await interaction.followup.send("**Current Free Games:**")
-        for e in embeds:
-            await interaction.followup.send(embed=e)
+        await send_embeds(interaction.followup.send, "**Current Free Games:**", embeds)
     else:
         await interaction.followup.send("No current games to display.")
 
 @bot.tree.command(name="upcoming", description="Show upcoming free games")
 async def upcoming_slash(interaction: discord.Interaction):
-    await interaction.response.defer()
-    embeds = make_embeds(posted_upcoming, ctx_mention=interaction.user.mention, upcoming=True, wide_image=True)
+    await interaction.response.defer(thinking=False)
+    embeds = get_cached_embeds(upcoming=True, ctx_mention=interaction.user.mention)
     if embeds:
-        await interaction.followup.send("**Upcoming Free Games:**")
-        for e in embeds:
-            await interaction.followup.send(embed=e)
+        await send_embeds(interaction.followup.send, "**Upcoming Free Games:**", embeds)
     else:
         await interaction.followup.send("No upcoming games to display.")
 
 @bot.tree.command(name="next", description="Time until next automatic check")
 async def next_slash(interaction: discord.Interaction):
     now = datetime.now(CET)
-    target = now.replace(hour=17, minute=1, second=0, microsecond=0)
+    target = daily_target_for(now)
     
     if now >= target:
         target += timedelta(days=1)
     
-    time_diff = target - now
-    hours = int(time_diff.total_seconds() // 3600)
-    minutes = int((time_diff.total_seconds() % 3600) // 60)
+    # Use timestamps: datetimes sharing a ZoneInfo subtract in wall-clock time (wrong across DST)
+    remaining = target.timestamp() - now.timestamp()
+    hours = int(remaining // 3600)
+    minutes = int((remaining % 3600) // 60)
     
-    embed = discord.Embed(
-        title="Next Automatic Check",
-        description=f"Next check: **{target.strftime('%H:%M')} CET**",
-        color=0x1E3A8A
-    )
-    embed.add_field(name="Time Remaining", value=f"{hours}h {minutes}m", inline=True)
-    embed.add_field(name="Date", value=target.strftime('%Y-%m-%d'), inline=True)
+    embed = NEXT_CHECK_EMBED.copy()
+    embed.set_field_at(0, name="Time Remaining", value=f"{hours}h {minutes}m", inline=True)
+    embed.set_field_at(1, name="Date", value=target.strftime('%Y-%m-%d'), inline=True)
     
     await interaction.response.send_message(embed=embed)
 
@@ -412,16 +614,14 @@ async def check_slash(interaction: discord.Interaction):
 
 @bot.tree.command(name="confirm", description="Show games again if unchanged")
 async def confirm_slash(interaction: discord.Interaction):
-    await interaction.response.defer()
+    await interaction.response.defer(thinking=False)
     now = datetime.now(CET)
     expiry = pending_confirmations.get(interaction.user.mention)
     if expiry and now <= expiry:
         pending_confirmations.pop(interaction.user.mention)
-        embeds = make_embeds(posted_games, ctx_mention=interaction.user.mention, upcoming=False, wide_image=True)
+        embeds = get_cached_embeds(upcoming=False, ctx_mention=interaction.user.mention)
         if embeds:
-            await interaction.followup.send("**Current Free Games:**")
-            for e in embeds:
-                await interaction.followup.send(embed=e)
+            await send_embeds(interaction.followup.send, "**Current Free Games:**", embeds)
         else:
             await interaction.followup.send("No current games to display.")
     else:
@@ -493,28 +693,52 @@ async def shutdown_slash(interaction: discord.Interaction):
 # -------------------------------
 # Daily scheduled task at 17:01 CET
 # -------------------------------
-@tasks.loop(minutes=15)
-async def daily_check():
-    """Check every 15 minutes. Run only if time >= 17:01 and check hasn't run today."""
-    global last_daily_run
-    now = datetime.now(CET)
-    today_str = str(now.date())
-    
-    # Check if it's 17:01 or later and check hasn't run today
-    target_time = now.replace(hour=17, minute=1, second=0, microsecond=0)
-    if now >= target_time and last_daily_run != today_str:
-        print(f"Running daily check at {now.strftime('%Y-%m-%d %H:%M:%S')}")
-        result = await run_check(is_auto_check=True)
-        if result:
-            next_run = now + timedelta(days=1)
-            print(f"Next daily check scheduled for {next_run.strftime('%Y-%m-%d at 17:01:00 CET')}")
-        else:
-            print("Daily check failed, will retry in 15 minutes")
-
-@daily_check.before_loop
-async def before_daily_check():
+async def daily_loop():
+    """Sleep until 17:01 CET, run the check once, then re-arm for the next day."""
     await bot.wait_until_ready()
     print("Daily check task started - will run after 17:01 CET every day")
+    failures = 0
+    failures_on = None
+    gave_up_on = None
+    while not bot.is_closed():
+        now = datetime.now(CET)
+        today_str = str(now.date())
+        target_time = daily_target_for(now)
+
+        # Each day gets a fresh retry budget
+        if failures_on != today_str:
+            failures = 0
+            failures_on = today_str
+
+        if now >= target_time and last_daily_run != today_str and gave_up_on != today_str:
+            print(f"Running daily check at {now.strftime('%Y-%m-%d %H:%M:%S')}")
+            try:
+                result = await run_check(is_auto_check=True)
+            except Exception:
+                # Keep the task alive; an unhandled error here would silently stop daily posts
+                traceback.print_exc()
+                result = False
+            if result:
+                failures = 0
+                next_run = now + timedelta(days=1)
+                print(f"Next daily check scheduled for {next_run.strftime('%Y-%m-%d at 17:01:00 CET')}")
+            else:
+                failures += 1
+                if failures >= DAILY_MAX_RETRIES:
+                    # Every retry may cost an API call, so stop for today rather than drain the quota
+                    print(f"Daily check failed {failures} times, giving up until tomorrow")
+                    gave_up_on = today_str
+                    failures = 0
+                else:
+                    print(f"Daily check failed, will retry in {DAILY_RETRY_SECONDS // 60} minutes")
+                    await asyncio.sleep(DAILY_RETRY_SECONDS)
+            continue
+
+        if now >= target_time:
+            target_time += timedelta(days=1)
+        # Sleep in bounded chunks and re-evaluate on wake, so host suspend or a
+        # wall-clock correction can't delay the check by more than DAILY_MAX_SLEEP_SECONDS
+        await asyncio.sleep(min(target_time.timestamp() - now.timestamp(), DAILY_MAX_SLEEP_SECONDS))
 
 # -------------------------------
 # Run the bot